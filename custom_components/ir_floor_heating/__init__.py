@@ -5,16 +5,15 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from homeassistant.const import Platform
-from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.core import ServiceCall, SupportsResponse, callback
 
-from .climate import IRFloorHeatingClimate
+from .climate import ClimateConfig, IRFloorHeatingClimate
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,35 +25,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up IR floor heating from a config entry."""
     _LOGGER.info("Setting up IR Floor Heating integration")
 
-    # Set up climate platform first and store climate entity in runtime_data
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.CLIMATE])
-
-    # Now set up the remaining platforms that depend on runtime_data
-    await hass.config_entries.async_forward_entry_setups(
-        entry, [Platform.BINARY_SENSOR, Platform.SENSOR]
+    # Create the climate entity up front so every platform can read it from
+    # runtime_data, regardless of the order in which they are set up
+    entry.runtime_data = IRFloorHeatingClimate(
+        hass, ClimateConfig.from_entry(hass, entry)
     )
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     # Register service to toggle maintain comfort limit
     @callback
-    def handle_set_maintain_comfort_limit(call: ServiceCall) -> ServiceResponse:
+    def handle_set_maintain_comfort_limit(call: ServiceCall) -> None:
         """Handle service call to set maintain comfort limit."""
         enabled = call.data.get(ATTR_ENABLED, True)
-        climate_entity = entry.runtime_data
+        climate_entity: IRFloorHeatingClimate | None = entry.runtime_data
 
-        if isinstance(climate_entity, IRFloorHeatingClimate):
+        if climate_entity is not None:
             climate_entity.set_maintain_comfort_limit(enabled=enabled)
-            return {"success": True, "enabled": enabled}
+            return
 
         _LOGGER.error("Climate entity not found in runtime_data")
-        return {"success": False, "error": "Climate entity not found"}
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_MAINTAIN_COMFORT_LIMIT,
         handle_set_maintain_comfort_limit,
-        supports_response=SupportsResponse.OPTIONAL,
+        supports_response=SupportsResponse.NONE,
     )
 
     return True
@@ -62,9 +60,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(
-        entry, [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.SENSOR]
-    )
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.event import async_track_state_change_event
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -33,13 +32,15 @@ async def async_setup_entry(
     """Set up IR floor heating binary sensors from a config entry."""
     climate_entity = config_entry.runtime_data
 
+    # State derives from the in-process climate entity, no initial update needed
     async_add_entities(
-        [
+        (
             IRFloorHeatingSafetyVetoBinarySensor(climate_entity, config_entry),
             IRFloorHeatingMaintainComfortLimitBinarySensor(
                 climate_entity, config_entry
             ),
-        ]
+        ),
+        update_before_add=False,
     )
 
 
@@ -50,6 +51,18 @@ class IRFloorHeatingBaseBinarySensor(BinarySensorEntity):
     _attr_should_poll = False
     # Binary sensors are diagnostic by default
     _attr_entity_registry_enabled_default = True
+    # Climate state attribute mirrored by this sensor
+    _climate_attribute: ClassVar[str]
+    # Suffix appended to the climate unique_id, resolved once per subclass
+    _unique_id_suffix: ClassVar[str]
+    # Reads the mirrored attribute from the climate entity
+    _get_climate_value: ClassVar[attrgetter[bool]]
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Resolve per-subclass constants from the class attributes."""
+        super().__init_subclass__(**kwargs)
+        cls._unique_id_suffix = cls._attr_translation_key
+        cls._get_climate_value = attrgetter(cls._climate_attribute)
 
     def __init__(
         self,
@@ -59,63 +72,42 @@ class IRFloorHeatingBaseBinarySensor(BinarySensorEntity):
         """Initialize the binary sensor."""
         self._climate_entity = climate_entity
         # Inherit device info from climate entity
-        device_info = getattr(climate_entity, "_attr_device_info", None)
-        if device_info is not None:
+        if (device_info := climate_entity.device_info) is not None:
             self._attr_device_info = device_info
         # Use climate entity's unique_id as base for shorter, consistent IDs
-        self._attr_unique_id = (
-            f"{climate_entity.unique_id}_{self._attr_translation_key}"
-        )
-        self._last_reported_value: bool | None = None
+        self._attr_unique_id = f"{climate_entity.unique_id}_{self._unique_id_suffix}"
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
 
-        # Update when climate entity updates
-        @callback
-        def _handle_climate_update(_event: Event[EventStateChangedData]) -> None:
-            """Handle updates from the climate entity only if value changed."""
-            current_value = self.is_on
-            # Only write state if the value actually changed
-            if current_value != self._last_reported_value:
-                self._last_reported_value = current_value
-                self.async_write_ha_state()
-
-        # Track the climate entity state changes
+        # Write state only when the climate entity reports a transition
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._climate_entity.entity_id],
-                _handle_climate_update,
+            self._climate_entity.register_attr_listener(
+                self._climate_attribute, self.async_write_ha_state
             )
         )
+        # The entity platform writes the initial state once this returns
 
-        # Trigger initial update
-        self.async_write_ha_state()
+    @property
+    def is_on(self) -> bool:
+        """Return the mirrored climate attribute."""
+        return self._get_climate_value(self._climate_entity)
 
 
 class IRFloorHeatingSafetyVetoBinarySensor(IRFloorHeatingBaseBinarySensor):
     """Binary sensor for safety veto status."""
 
     _attr_translation_key = "safety_veto_active"
+    _climate_attribute = "safety_veto_active"
     _attr_device_class = BinarySensorDeviceClass.SAFETY
     _attr_entity_registry_enabled_default = True
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if safety veto is active."""
-        return self._climate_entity.safety_veto_active
-
 
 class IRFloorHeatingMaintainComfortLimitBinarySensor(IRFloorHeatingBaseBinarySensor):
     """Binary sensor for maintain comfort limit mode status."""
 
     _attr_translation_key = "maintain_comfort_limit"
+    _climate_attribute = "maintain_comfort_limit"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_entity_registry_enabled_default = True
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if maintain comfort limit is enabled."""
-        return self._climate_entity.maintain_comfort_limit
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import ClimateEntity
@@ -27,17 +27,20 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import (
-    DOMAIN as HOMEASSISTANT_DOMAIN,
-)
-from homeassistant.core import (
+    CALLBACK_TYPE,
     CoreState,
     Event,
     EventStateChangedData,
     callback,
 )
+from homeassistant.core import (
+    DOMAIN as HOMEASSISTANT_DOMAIN,
+)
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device import async_entity_id_to_device
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
     async_track_time_interval,
 )
@@ -45,8 +48,10 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import HomeAssistant, State
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import (
@@ -80,6 +85,7 @@ from .const import (
     CONF_SAFETY_HYSTERESIS,
     CONF_TARGET_TEMP,
     CONF_TEMP_STEP,
+    CONTROL_UPDATES_PER_CYCLE,
     DEFAULT_BOOST_TEMP_DIFF,
     DEFAULT_CYCLE_PERIOD,
     DEFAULT_FLOOR_PID_KD,
@@ -96,7 +102,11 @@ from .const import (
     DEFAULT_SAFETY_BUDGET_CAPACITY,
     DEFAULT_SAFETY_BUDGET_INTERVAL,
     DEFAULT_SAFETY_HYSTERESIS,
+    FORCED_UPDATE_COOLDOWN,
+    HEATER_COMMAND_TIMEOUT,
     MAX_DT_FOR_KALMAN_UPDATE,
+    MIN_CONTROL_INTERVAL,
+    PID_TIME_BASE,
 )
 from .control import ControlConfig, DualPIDController
 from .filters import FusionKalmanFilter
@@ -109,12 +119,21 @@ _LOGGER = logging.getLogger(__name__)
 # Serialize updates to prevent overwhelming the device
 PARALLEL_UPDATES = 1
 
+# Listener registry key for "the climate state was written"
+_STATE_WRITTEN = "state"
+
+
+def _is_on(state: State | None) -> bool | None:
+    """Return whether a heater state is on, or None if it is missing."""
+    if state is None:
+        return None
+    return state.state == STATE_ON
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClimateConfig:
     """Configuration for IR floor heating climate entity."""
 
-    hass: HomeAssistant
     name: str
     heater_entity_id: str
     room_sensor_entity_id: str
@@ -168,25 +187,21 @@ class ClimateConfig:
                     return [fb_val]
             return []
 
+        def first(values: list[str]) -> str:
+            return values[0] if values else ""
+
         room_sensors = get_list(CONF_ROOM_SENSORS, CONF_ROOM_SENSOR)
         floor_sensors = get_list(CONF_FLOOR_SENSORS, CONF_FLOOR_SENSOR)
         power_sensors = get_list(CONF_POWER_SENSORS)
 
         # Handle heater entity (single relay)
-        heater_id = config.get(CONF_HEATER)
-        if not heater_id:
-            relays = get_list(CONF_RELAYS)
-            heater_id = relays[0] if relays else ""
+        heater_id = first(get_list(CONF_HEATER, CONF_RELAYS))
 
-        room_sensor_id = config.get(CONF_ROOM_SENSOR) or (
-            room_sensors[0] if room_sensors else ""
-        )
-        floor_sensor_id = config.get(CONF_FLOOR_SENSOR) or (
-            floor_sensors[0] if floor_sensors else ""
-        )
+        # Legacy single-sensor keys take precedence, and may also hold a list
+        room_sensor_id = first(get_list(CONF_ROOM_SENSOR) or room_sensors)
+        floor_sensor_id = first(get_list(CONF_FLOOR_SENSOR) or floor_sensors)
 
         return cls(
-            hass=hass,
             name=config.get(CONF_NAME, DEFAULT_NAME),
             heater_entity_id=heater_id,
             room_sensor_entity_id=room_sensor_id,
@@ -241,18 +256,13 @@ class ClimateConfig:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the IR floor heating climate entity from a config entry."""
-    climate_config = ClimateConfig.from_entry(hass, config_entry)
-    climate_entity = IRFloorHeatingClimate(climate_config)
-
-    # Store climate entity in runtime_data for access by sensor platform
-    config_entry.runtime_data = climate_entity
-
-    async_add_entities([climate_entity])
+    # The climate entity is created in the integration's async_setup_entry
+    async_add_entities([config_entry.runtime_data])
 
 
 class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
@@ -266,10 +276,14 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
     _attr_has_entity_name = True
     _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, config: ClimateConfig) -> None:
+    def __init__(  # noqa: PLR0915
+        self, hass: HomeAssistant, config: ClimateConfig
+    ) -> None:
         """Initialize the IR floor heating climate device."""
-        self.hass = config.hass
+        self.hass = hass
         self.heater_entity_id = config.heater_entity_id
+        # Shared by the turn on/off calls, the service layer copies it
+        self._heater_service_data = {ATTR_ENTITY_ID: config.heater_entity_id}
         self.room_sensor_entity_id = config.room_sensor_entity_id
         self.floor_sensor_entity_id = config.floor_sensor_entity_id
         self.room_sensors = config.room_sensors
@@ -278,9 +292,7 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         self._last_kf_update = dt_util.utcnow()
 
         # Set up device info from heater entity
-        if device_entry := async_entity_id_to_device(
-            config.hass, config.heater_entity_id
-        ):
+        if device_entry := async_entity_id_to_device(hass, config.heater_entity_id):
             self._attr_device_info = DeviceInfo(
                 identifiers=device_entry.identifiers,
                 connections=device_entry.connections,
@@ -295,15 +307,34 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         # Control parameters
         self.min_cycle_duration = config.min_cycle_duration
         self.cycle_period = config.cycle_period
-        self._keep_alive = config.keep_alive
+        # Floor heating reacts in minutes, so the Kalman filter and PID run on a
+        # fixed interval instead of on every sensor event
+        self._control_interval = max(
+            timedelta(seconds=MIN_CONTROL_INTERVAL),
+            config.cycle_period / CONTROL_UPDATES_PER_CYCLE,
+        )
+        # Keep-alive re-runs the same control update, so share the one timer
+        if config.keep_alive is not None:
+            self._control_interval = min(self._control_interval, config.keep_alive)
         self._boost_mode = config.boost_mode
         self._boost_temp_diff = config.boost_temp_diff
         self._safety_hysteresis = config.safety_hysteresis
+        # Floor temperature below which an active veto may be released
+        self._veto_release_temp = config.max_floor_temp - config.safety_hysteresis
         self._maintain_comfort_limit = config.maintain_comfort_limit
+        # Built once, rebuilt only when maintain_comfort changes at runtime
+        self._control_config = ControlConfig(
+            max_floor_temp=self._max_floor_temp,
+            comfort_offset=self._max_floor_temp_diff,
+            maintain_comfort=self._maintain_comfort_limit,
+            safety_hysteresis=self._safety_hysteresis,
+            boost_mode=self._boost_mode,
+            boost_temp_diff=self._boost_temp_diff,
+        )
 
         # Sensor Manager
         self._sensor_manager = SensorManager(
-            config.hass,
+            hass,
             config.room_sensors,
             config.floor_sensors,
             config.power_sensors,
@@ -319,7 +350,6 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         self._active = False
         self._room_temp: float | None = None
         self._floor_temp: float | None = None
-        self._temp_lock = asyncio.Lock()
         self._attr_temperature_unit = config.unit
         self._attr_unique_id = config.unique_id
         self._attr_supported_features = (
@@ -329,14 +359,39 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         )
 
         # TPI control state
-        self._cycle_start_time: datetime | None = None
         self._demand_percent: float = 0.0
         self._safety_veto_active: bool = False
         self._last_relay_state: bool = False
+        # When the last heater command was sent, cleared once its state change
+        # arrives. A command that is never confirmed may be resent on timeout
+        self._heater_command_at: datetime | None = None
+        self._heater_command_timeout = timedelta(seconds=HEATER_COMMAND_TIMEOUT)
+        # Heater on/off as last seen on the state machine, None if unknown
+        self._device_active: bool | None = None
+        # Pending TPI callback, armed for the next relay transition
+        self._tpi_unsub: CALLBACK_TYPE | None = None
+        # Scenes and automations often set mode and setpoint back to back,
+        # so their forced control updates are coalesced into one
+        self._forced_update_debouncer: Debouncer[Coroutine[Any, Any, None]] = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=FORCED_UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_forced_control_update,
+        )
+
+        # Callbacks fired on transitions of tracked attributes (e.g. binary sensors)
+        self._attr_listeners: dict[str, set[Callable[[], None]]] = {}
 
         # Relay toggle counter (restored from previous state via RestoreEntity)
         self._relay_toggle_count: int = 0
 
+        # Cached extra_state_attributes, reset to None whenever an input changes
+        self._attrs_cache: dict[str, Any] | None = None
+        # Effective floor limit memoized on the inputs that can change at runtime
+        self._effective_limit_key: tuple[float, float, bool] | None = None
+        self._effective_limit: float = config.max_floor_temp
+
         # Kalman Filter for sensor fusion
         self._kf = FusionKalmanFilter(
             num_floor_sensors=len(self.floor_sensors),
@@ -372,8 +427,9 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         self._floor_demand_percent: float = 0.0
         self._final_demand_percent: float = 0.0
 
-        _LOGGER.info(
-            "IR Floor Heating initialized: '%s' - Room sensors: %s, "
+        _LOGGER.info("IR Floor Heating initialized: '%s'", config.name)
+        _LOGGER.debug(
+            "IR Floor Heating '%s' configuration - Room sensors: %s, "
             "Floor sensors: %s, Heater: %s, "
             "Max floor temp: %.1f°C, Max diff: %.1f°C, Cycle period: %ds, "
             "Room PID (Kp=%.1f, Ki=%.1f, Kd=%.1f), "
@@ -398,12 +454,15 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         await super().async_added_to_hass()
 
         # Add sensor listeners for all entities in the MIMO lists
+        # dict.fromkeys dedups while keeping a stable, reproducible order
         entities_to_track = list(
-            set(
-                self.room_sensors
-                + self.floor_sensors
-                + [self.heater_entity_id]
-                + self.power_sensors
+            dict.fromkeys(
+                chain(
+                    self.room_sensors,
+                    self.floor_sensors,
+                    (self.heater_entity_id,),
+                    self.power_sensors,
+                )
             )
         )
 
@@ -412,34 +471,25 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
                 self.hass, entities_to_track, self._async_sensor_changed
             )
         )
+        # Seed the heater state, later changes arrive through the listener
+        self._device_active = _is_on(self.hass.states.get(self.heater_entity_id))
 
-        # Set up keep-alive timer
-        if self._keep_alive:
-            self.async_on_remove(
-                async_track_time_interval(
-                    self.hass, self._async_control_heating, self._keep_alive
-                )
-            )
-
-        # Set up TPI cycle timer
+        # Set up periodic control update (Kalman filter, safety veto and PID),
+        # which also serves as the keep-alive
         self.async_on_remove(
             async_track_time_interval(
-                self.hass, self._async_tpi_cycle, timedelta(seconds=1)
+                self.hass, self._async_control_tick, self._control_interval
             )
         )
 
+        # TPI cycle is scheduled at relay transitions, cancel it on removal
+        self.async_on_remove(self._async_cancel_tpi_cycle)
+        self.async_on_remove(self._forced_update_debouncer.async_cancel)
+
         @callback
         def _async_startup(_: Event | None = None) -> None:
             """Init on startup."""
-            # Trigger initial control update to gather all sensor states
-            self.hass.async_create_task(
-                self._async_control_heating(force=True), eager_start=True
-            )
-
-            self.hass.async_create_task(
-                self._check_switch_initial_state(), eager_start=True
-            )
-
+            self.hass.async_create_task(self._async_startup_update(), eager_start=True)
             self.async_write_ha_state()
 
         if self.hass.state is CoreState.running:
@@ -480,6 +530,8 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         if not self._hvac_mode:
             self._hvac_mode = HVACMode.OFF
 
+        self._attrs_cache = None
+
     @property
     def precision(self) -> float:
         """Return the precision of the system."""
@@ -535,6 +587,9 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
+        if (attrs := self._attrs_cache) is not None:
+            return attrs
+
         attrs = {
             "floor_temperature": self._floor_temp,
             "room_temperature": self._room_temp,
@@ -552,6 +607,7 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
             attrs["effective_floor_limit"] = round(effective_limit, 1)
             attrs["safety_budget_tokens"] = round(self._safety_budget.tokens, 2)
 
+        self._attrs_cache = attrs
         return attrs
 
     @property
@@ -620,35 +676,77 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         """Return whether maintain comfort limit mode is active."""
         return self._maintain_comfort_limit
 
-    @property
-    def _control_config(self) -> ControlConfig:
-        """Return the current control configuration."""
-        return ControlConfig(
-            max_floor_temp=self._max_floor_temp,
-            comfort_offset=self._max_floor_temp_diff,
-            maintain_comfort=self._maintain_comfort_limit,
-            safety_hysteresis=self._safety_hysteresis,
-            boost_mode=self._boost_mode,
-            boost_temp_diff=self._boost_temp_diff,
-        )
+    @callback
+    def register_attr_listener(
+        self, attribute: str, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Register a callback fired when a tracked attribute transitions.
+
+        Returns a callable that removes the listener again.
+        """
+        listeners = self._attr_listeners.setdefault(attribute, set())
+        listeners.add(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            listeners.discard(listener)
+
+        return _remove_listener
+
+    @callback
+    def register_state_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Register a callback fired after every state write of this entity.
+
+        Unlike tracking the state machine, this does not need the entity_id,
+        so it is safe before this entity has been added.
+
+        Returns a callable that removes the listener again.
+        """
+        return self.register_attr_listener(_STATE_WRITTEN, listener)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and notify the state listeners."""
+        super().async_write_ha_state()
+        self._notify_attr_listeners(_STATE_WRITTEN)
+
+    @callback
+    def _notify_attr_listeners(self, attribute: str) -> None:
+        """Call the listeners registered for an attribute."""
+        for listener in tuple(self._attr_listeners.get(attribute, ())):
+            listener()
 
     def set_maintain_comfort_limit(self, *, enabled: bool) -> None:
         """Enable or disable maintain comfort limit mode."""
-        self._maintain_comfort_limit = enabled
+        if enabled != self._maintain_comfort_limit:
+            self._maintain_comfort_limit = enabled
+            self._control_config = replace(
+                self._control_config, maintain_comfort=enabled
+            )
+            self._attrs_cache = None
+            self._notify_attr_listeners("maintain_comfort_limit")
+            # The floor target changes, recompute demand and write state once.
+            # Not forced, so a running cycle and the veto hysteresis are kept
+            self.hass.async_create_task(self._async_control_tick(), eager_start=True)
         _LOGGER.info(
             "Maintain comfort limit mode %s", "enabled" if enabled else "disabled"
         )
-        self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set hvac mode."""
         if hvac_mode == HVACMode.HEAT:
             self._hvac_mode = HVACMode.HEAT
-            await self._async_control_heating(force=True)
+            await self._forced_update_debouncer.async_call()
         elif hvac_mode == HVACMode.OFF:
             self._hvac_mode = HVACMode.OFF
+            # Nothing left for the TPI timer to do until heating resumes
+            self._async_cancel_tpi_cycle()
             if self._is_device_active:
-                await self._async_heater_turn_off()
+                await self._async_set_heater(on=False)
         else:
             _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
             return
@@ -659,38 +757,117 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
         self._target_temp = temperature
+        self._attrs_cache = None
         # Reset PID integral terms to prevent old windup from affecting new setpoint
         self._dual_pid.reset()
+        await self._forced_update_debouncer.async_call()
+        self.async_write_ha_state()
+
+    async def _async_forced_control_update(self) -> None:
+        """Run the debounced forced control update and write state."""
         await self._async_control_heating(force=True)
         self.async_write_ha_state()
 
-    async def _async_sensor_changed(self, _event: Event[EventStateChangedData]) -> None:
+    @callback
+    def _async_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
         """Handle any sensor or relay state change."""
+        # New readings are picked up by the next periodic control update, only
+        # keep the power total current, check floor readings against the
+        # safety limit and refresh state so hvac_action follows the relay
+        data = event.data
+        entity_id = data["entity_id"]
+        sensor_manager = self._sensor_manager
+        if sensor_manager.is_power_sensor(entity_id):
+            sensor_manager.update_power(entity_id, data["new_state"])
+        if (
+            floor_reading := sensor_manager.get_floor_reading(
+                entity_id, data["new_state"]
+            )
+        ) is not None:
+            self._async_check_floor_limit(floor_reading)
+        if entity_id != self.heater_entity_id:
+            return
+        commanded = self._heater_command_at is not None
+        self._heater_command_at = None
+        new_state = data["new_state"]
+        old_state = data["old_state"]
+        device_active = self._device_active = _is_on(new_state)
+        if (
+            new_state is not None
+            and old_state is not None
+            and new_state.state == old_state.state
+        ):
+            # Attribute-only update (e.g. power reading), hvac_action unchanged
+            return
+        if (
+            not commanded
+            and device_active is not None
+            and device_active != self._last_relay_state
+        ):
+            # Switched outside the thermostat (e.g. manually), reconcile now
+            # instead of at the next scheduled transition
+            self._async_cancel_tpi_cycle()
+            self._tpi_unsub = async_call_later(self.hass, 0, self._async_tpi_cycle)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_check_floor_limit(self, floor_temp: float) -> None:
+        """
+        Run the control update early when a floor reading reaches the limit.
+
+        The reading is only a trigger. The veto is decided on the fused floor
+        estimate by the regular update, so a single noisy reading neither
+        engages it nor spends safety budget, while a real overheat does not
+        wait for the next periodic update.
+
+        Args:
+            floor_temp: The new reading of one of the floor sensors.
+
+        """
+        if (
+            self._safety_veto_active
+            or floor_temp < self._max_floor_temp
+            or not self._active
+            or self._hvac_mode == HVACMode.OFF
+        ):
+            return
+        self.hass.async_create_task(self._async_control_tick(), eager_start=True)
+
+    async def _async_control_tick(self, _time: datetime | None = None) -> None:
+        """Run the periodic control update and publish the result."""
         await self._async_control_heating()
         self.async_write_ha_state()
 
-    async def _check_switch_initial_state(self) -> None:
-        """Prevent the device from keep running if HVACMode.OFF."""
+    async def _async_startup_update(self) -> None:
+        """Run the initial control update, then check the heater switch."""
+        # Trigger initial control update to gather all sensor states
+        await self._async_control_heating(force=True)
+
+        # Prevent the device from keep running if HVACMode.OFF
         if self._hvac_mode == HVACMode.OFF and self._is_device_active:
             _LOGGER.warning(
                 "The climate mode is OFF, but heater switch is ON. "
                 "Turning off device %s",
                 self.heater_entity_id,
             )
-            await self._async_heater_turn_off()
+            await self._async_set_heater(on=False)
 
     def _calculate_effective_floor_limit(self) -> float:
         """Calculate effective floor temperature limit based on conditions."""
-        if self._room_temp is None:
+        room_temp = self._room_temp
+        if room_temp is None:
             return self._max_floor_temp
 
-        return self._dual_pid.get_floor_target(
-            room_temp=self._room_temp,
-            target_room=self._target_temp
-            if self._target_temp is not None
-            else self._room_temp,
-            config=self._control_config,
-        )
+        target_temp = self._target_temp if self._target_temp is not None else room_temp
+        key = (room_temp, target_temp, self._maintain_comfort_limit)
+        if key != self._effective_limit_key:
+            self._effective_limit = self._dual_pid.get_floor_target(
+                room_temp=room_temp,
+                target_room=target_temp,
+                config=self._control_config,
+            )
+            self._effective_limit_key = key
+        return self._effective_limit
 
     def _check_safety_veto(self, *, bypass_hysteresis: bool = False) -> bool:
         """
@@ -704,34 +881,38 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
                 Used when setpoint changes to allow immediate veto release.
 
         """
-        if self._floor_temp is None or self._room_temp is None:
+        floor_temp = self._floor_temp
+        room_temp = self._room_temp
+        if floor_temp is None or room_temp is None:
             # If we can't read sensors, veto heating for safety
             _LOGGER.warning(
                 "SAFETY VETO ACTIVE: Missing sensor data (Floor: %s, Room: %s) - "
                 "Heating disabled for safety",
-                ("None" if self._floor_temp is None else f"{self._floor_temp:.1f}°C"),
-                ("None" if self._room_temp is None else f"{self._room_temp:.1f}°C"),
+                ("None" if floor_temp is None else f"{floor_temp:.1f}°C"),
+                ("None" if room_temp is None else f"{room_temp:.1f}°C"),
             )
             return True
 
         # Use absolute max floor temp for safety veto, not the effective PID limit
         limit = self._max_floor_temp
+        veto_active = self._safety_veto_active
+
+        # Fast path: an inactive veto only engages at the absolute limit
+        if not veto_active and floor_temp < limit:
+            return False
 
         # Determine if veto SHOULD be active based on temperature
-        should_veto = self._safety_veto_active
-        if self._floor_temp >= limit:
+        if floor_temp >= limit:
             should_veto = True
-        elif not bypass_hysteresis and self._floor_temp > (
-            limit - self._safety_hysteresis
-        ):
+        elif not bypass_hysteresis and floor_temp > self._veto_release_temp:
             # In hysteresis band: maintain current decision
-            should_veto = self._safety_veto_active
+            should_veto = veto_active
         else:
             # Below hysteresis band - release veto
             should_veto = False
 
         # Apply budget bucket for transitions to protect relay
-        if should_veto != self._safety_veto_active:
+        if should_veto != veto_active:
             if should_veto:
                 # Engaging veto (Turning OFF) - Always allowed for safety,
                 # but consumes budget
@@ -739,7 +920,7 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
                 _LOGGER.warning(
                     "SAFETY VETO ENGAGED: Floor temp %.1f°C >= "
                     "Max limit %.1f°C - Heating OFF",
-                    self._floor_temp,
+                    floor_temp,
                     limit,
                 )
                 return True
@@ -749,200 +930,250 @@ class IRFloorHeatingClimate(ClimateEntity, RestoreEntity):
                 _LOGGER.info(
                     "SAFETY VETO RELEASED: Floor temp %.1f°C < "
                     "(Limit %.1f°C - Hysteresis %.1f°C) - Heating allowed",
-                    self._floor_temp,
+                    floor_temp,
                     limit,
                     self._safety_hysteresis,
                 )
                 return False
 
-            # No budget available - delay release
-            if self._safety_veto_active:
+            # No budget available - delay release (repeats every tick)
+            if veto_active and _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "SAFETY VETO RELEASE DELAYED: Floor temp %.1f°C "
                     "is safe but relay toggle budget exceeded",
-                    self._floor_temp,
+                    floor_temp,
                 )
             return True
 
-        # No state change requested, but if we are in veto, log reason if in debug
-        if self._safety_veto_active and not should_veto:
-            # This happens when should_veto is False but we returned True due to budget
-            _LOGGER.debug(
-                "SAFETY VETO MAINTAINED (Budget): Floor temp %.1f°C",
-                self._floor_temp,
-            )
-
-        return self._safety_veto_active
+        return veto_active
 
     async def _async_control_heating(
         self, _time: datetime | None = None, *, force: bool = False
     ) -> None:
         """Control heating using dual-PID min-selector with TPI actuation."""
-        async with self._temp_lock:
-            # 1. Gather data and update Kalman Filter
-            floor_values = self._sensor_manager.get_floor_temperatures()
-            room_values = self._sensor_manager.get_room_temperatures()
-            total_power = self._sensor_manager.calculate_total_power()
-
-            now = dt_util.utcnow()
-            dt = (now - self._last_kf_update).total_seconds()
-            self._last_kf_update = now
-
-            # Guard against non-positive or unreasonable dt values
-            if dt <= 0 or dt > MAX_DT_FOR_KALMAN_UPDATE:
-                _LOGGER.debug(
-                    "Invalid dt %.3f for Kalman filter update, using fallback dt=1.0",
-                    dt,
-                )
-                dt = 1.0
-            self._kf.update(floor_values, room_values, total_power, dt)
+        sensor_manager = self._sensor_manager
+        kf = self._kf
+        tpi_controller = self._tpi_controller
 
-            # Update fused temperature values
-            self._floor_temp = self._kf.floor_temp
-            self._room_temp = self._kf.room_temp
+        # 1. Gather data and update Kalman Filter
+        floor_values = sensor_manager.get_floor_temperatures()
+        room_values = sensor_manager.get_room_temperatures()
+        total_power = sensor_manager.calculate_total_power()
 
-            # Activate control once we have all required temperatures
-            if not self._active and None not in (
+        now = dt_util.utcnow()
+        dt = (now - self._last_kf_update).total_seconds()
+        self._last_kf_update = now
+
+        # Guard against non-positive or unreasonable dt values
+        if dt <= 0 or dt > MAX_DT_FOR_KALMAN_UPDATE:
+            _LOGGER.debug(
+                "Invalid dt %.3f for Kalman filter update, using fallback dt=1.0",
+                dt,
+            )
+            dt = 1.0
+        kf.update(floor_values, room_values, total_power, dt)
+
+        # Update fused temperature values
+        self._floor_temp = kf.floor_temp
+        self._room_temp = kf.room_temp
+        # Temperatures, demand, veto and budget may all change below
+        self._attrs_cache = None
+
+        # Activate control once we have all required temperatures
+        if not self._active and None not in (
+            self._room_temp,
+            self._floor_temp,
+            self._target_temp,
+        ):
+            self._active = True
+            tpi_controller.reset_cycle()
+            _LOGGER.info(
+                "IR floor heating active. Room: %.1f°C, Floor: %.1f°C, Target: %.1f°C",
                 self._room_temp,
                 self._floor_temp,
                 self._target_temp,
-            ):
-                self._active = True
-                self._tpi_controller.reset_cycle()
-                _LOGGER.info(
-                    "IR floor heating active. Room: %.1f°C, Floor: %.1f°C, "
-                    "Target: %.1f°C",
-                    self._room_temp,
-                    self._floor_temp,
-                    self._target_temp,
-                )
+            )
 
-            if not self._active or self._hvac_mode == HVACMode.OFF:
-                return
+        if not self._active or self._hvac_mode == HVACMode.OFF:
+            return
 
-            # Check safety veto (bypass hysteresis on forced updates)
-            self._safety_veto_active = self._check_safety_veto(bypass_hysteresis=force)
+        # Check safety veto (bypass hysteresis on forced updates)
+        veto_active = self._check_safety_veto(bypass_hysteresis=force)
+        if veto_active != self._safety_veto_active:
+            self._safety_veto_active = veto_active
+            self._notify_attr_listeners("safety_veto_active")
+            if veto_active:
+                # Cut a running ON phase instead of letting it finish
+                force = True
 
-            if self._safety_veto_active:
-                self._room_demand_percent = 0.0
-                self._floor_demand_percent = 0.0
-                self._final_demand_percent = 0.0
+        if self._safety_veto_active:
+            self._room_demand_percent = 0.0
+            self._floor_demand_percent = 0.0
+            self._final_demand_percent = 0.0
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Safety veto active - demand set to 0%%")
-            else:
-                self._calculate_demand()
+        else:
+            self._calculate_demand(dt / PID_TIME_BASE)
 
-            self._demand_percent = self._final_demand_percent
+        self._demand_percent = self._final_demand_percent
 
-            # Force immediate update if requested
-            if force:
-                self._tpi_controller.reset_cycle()
+        # Force immediate update if requested
+        if force:
+            tpi_controller.reset_cycle()
 
-    def _calculate_demand(self) -> None:
-        """Calculate PID demand based on current temperatures."""
-        if (
-            self._room_temp is not None
-            and self._target_temp is not None
-            and self._floor_temp is not None
-        ):
-            result = self._dual_pid.calculate(
-                room_temp=self._room_temp,
-                target_room=self._target_temp,
-                floor_temp=self._floor_temp,
+        self._async_rearm_tpi_cycle(now)
+
+    def _calculate_demand(self, dt: float) -> None:
+        """
+        Calculate PID demand based on current temperatures.
+
+        Args:
+            dt: Minutes since the last control update
+
+        """
+        room_temp = self._room_temp
+        target_temp = self._target_temp
+        floor_temp = self._floor_temp
+        if room_temp is not None and target_temp is not None and floor_temp is not None:
+            room_demand, floor_demand, selected_demand, _ = self._dual_pid.calculate(
+                room_temp=room_temp,
+                target_room=target_temp,
+                floor_temp=floor_temp,
                 config=self._control_config,
+                dt=dt,
+                # Memoized limit already computed by the safety veto check
+                floor_target=self._calculate_effective_floor_limit(),
             )
-            self._room_demand_percent = result.room_demand
-            self._floor_demand_percent = result.floor_demand
-            self._final_demand_percent = result.final_demand
+            final_demand = selected_demand
 
             # Override: Stop heating if room is above target
             # This takes precedence over maintain_comfort mode
-            if self._room_temp > self._target_temp:
-                self._final_demand_percent = 0.0
-                _LOGGER.debug(
-                    "Room above target: room_temp(%.1f) > target(%.1f), "
-                    "forcing demand to 0%%",
-                    self._room_temp,
-                    self._target_temp,
-                )
+            if room_temp > target_temp:
+                final_demand = 0.0
+
+            # Diagnostics only, skipped entirely unless debug logging is on
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                if room_temp > target_temp:
+                    _LOGGER.debug(
+                        "Room above target: room_temp(%.1f) > target(%.1f), "
+                        "forcing demand to 0%%",
+                        room_temp,
+                        target_temp,
+                    )
+                if selected_demand < room_demand:
+                    _LOGGER.debug(
+                        "Room PID restricted by floor limit: "
+                        "room_demand=%.1f%%, floor_demand=%.1f%%, final=%.1f%%",
+                        room_demand,
+                        floor_demand,
+                        final_demand,
+                    )
+                elif self._maintain_comfort_limit and room_temp >= target_temp:
+                    _LOGGER.debug(
+                        "Maintain comfort active: room_temp(%.1f) >= target(%.1f), "
+                        "using floor demand=%.1f%%",
+                        room_temp,
+                        target_temp,
+                        final_demand,
+                    )
 
-            if result.final_demand < result.room_demand:
-                _LOGGER.debug(
-                    "Room PID restricted by floor limit: "
-                    "room_demand=%.1f%%, floor_demand=%.1f%%, final=%.1f%%",
-                    self._room_demand_percent,
-                    self._floor_demand_percent,
-                    self._final_demand_percent,
-                )
-            elif self._maintain_comfort_limit and self._room_temp >= self._target_temp:
-                _LOGGER.debug(
-                    "Maintain comfort active: room_temp(%.1f) >= target(%.1f), "
-                    "using floor demand=%.1f%%",
-                    self._room_temp,
-                    self._target_temp,
-                    self._final_demand_percent,
-                )
+            self._room_demand_percent = room_demand
+            self._floor_demand_percent = floor_demand
+            self._final_demand_percent = final_demand
         else:
             self._room_demand_percent = 0.0
             self._floor_demand_percent = 0.0
             self._final_demand_percent = 0.0
 
+    @callback
+    def _async_schedule_tpi_cycle(self, now: datetime) -> None:
+        """Schedule the TPI cycle at the next possible relay transition."""
+        self._async_cancel_tpi_cycle()
+        transition = self._tpi_controller.next_transition_at(
+            now, self._final_demand_percent
+        )
+        if (sent := self._heater_command_at) is not None:
+            # Check back when an unconfirmed heater command times out
+            retry_at = sent + self._heater_command_timeout
+            if transition is None or retry_at < transition:
+                transition = retry_at
+        if transition is None:
+            # Idle without demand, the next control update checks again
+            return
+        delay = (transition - now).total_seconds()
+        self._tpi_unsub = async_call_later(
+            self.hass, max(delay, 0.0), self._async_tpi_cycle
+        )
+
+    @callback
+    def _async_rearm_tpi_cycle(self, now: datetime) -> None:
+        """Re-arm the TPI timer after demand or the cycle changed."""
+        # Runs immediately after a cycle reset
+        self._async_schedule_tpi_cycle(now)
+        if self._tpi_unsub is None and self._is_device_active:
+            # Idle, but the heater is still on (e.g. after a setpoint drop)
+            self._tpi_unsub = async_call_later(self.hass, 0, self._async_tpi_cycle)
+
+    @callback
+    def _async_cancel_tpi_cycle(self) -> None:
+        """Cancel the pending TPI cycle, if any."""
+        if self._tpi_unsub is not None:
+            self._tpi_unsub()
+            self._tpi_unsub = None
+
     async def _async_tpi_cycle(self, _time: datetime | None = None) -> None:
         """Execute Time Proportional & Integral (TPI) control cycle."""
+        self._tpi_unsub = None
         if not self._active or self._hvac_mode == HVACMode.OFF:
             return
 
+        # One timestamp for the whole cycle step
+        now = dt_util.utcnow()
+        tpi_controller = self._tpi_controller
+
         # Get relay state from TPI controller
-        should_be_on = self._tpi_controller.get_relay_state(self._final_demand_percent)
+        should_be_on = tpi_controller.get_relay_state(self._final_demand_percent, now)
+
+        # Actuate relay if state should change, unless that command is still
+        # in flight. An unknown heater state counts as off
+        sent = self._heater_command_at
+        if sent is not None and now - sent >= self._heater_command_timeout:
+            # Never confirmed (lost command or silent relay), allow a resend
+            self._heater_command_at = sent = None
+        already_commanded = sent is not None and should_be_on == self._last_relay_state
+        if should_be_on != bool(self._is_device_active) and not already_commanded:
+            # Cycle info is only gathered for this message
+            if _LOGGER.isEnabledFor(logging.INFO):
+                time_in_cycle, cycle_period, _ = tpi_controller.get_cycle_info(now)
+                _LOGGER.info(
+                    "Heater %s (demand %.0f%%, cycle %.0f/%.0fs)",
+                    "ON" if should_be_on else "OFF",
+                    self._final_demand_percent,
+                    time_in_cycle,
+                    cycle_period,
+                )
+            await self._async_set_heater(on=should_be_on)
 
-        # Actuate relay if state should change
-        if should_be_on and not self._is_device_active:
-            cycle_info = self._tpi_controller.get_cycle_info()
-            _LOGGER.info(
-                "Heater ON (demand %.0f%%, cycle %.0f/%.0fs)",
-                self._final_demand_percent,
-                cycle_info["time_in_cycle"],
-                cycle_info["cycle_period"],
-            )
-            await self._async_heater_turn_on()
-        elif not should_be_on and self._is_device_active:
-            cycle_info = self._tpi_controller.get_cycle_info()
-            _LOGGER.info(
-                "Heater OFF (demand %.0f%%, cycle %.0f/%.0fs)",
-                self._final_demand_percent,
-                cycle_info["time_in_cycle"],
-                cycle_info["cycle_period"],
-            )
-            await self._async_heater_turn_off()
+        self._async_schedule_tpi_cycle(now)
 
     @property
     def _is_device_active(self) -> bool | None:
         """Check if the heater device is currently active."""
-        if state := self.hass.states.get(self.heater_entity_id):
-            return state.state == STATE_ON
-        return None
+        return self._device_active
 
-    async def _async_heater_turn_on(self) -> None:
-        """Turn heater toggleable device on."""
-        if not self._last_relay_state:
-            self._last_relay_state = True
+    async def _async_set_heater(self, *, on: bool) -> None:
+        """Turn heater toggleable device on or off."""
+        self._heater_command_at = dt_util.utcnow()
+        if on != self._last_relay_state:
+            self._last_relay_state = on
             self._relay_toggle_count += 1
-        _LOGGER.debug("Turning on heater %s", self.heater_entity_id)
-        await self.hass.services.async_call(
-            HOMEASSISTANT_DOMAIN,
-            SERVICE_TURN_ON,
-            {ATTR_ENTITY_ID: self.heater_entity_id},
-            context=self._context,
+            self._attrs_cache = None
+        _LOGGER.debug(
+            "Turning %s heater %s", "on" if on else "off", self.heater_entity_id
         )
-
-    async def _async_heater_turn_off(self) -> None:
-        """Turn heater toggleable device off."""
-        if self._last_relay_state:
-            self._last_relay_state = False
-            self._relay_toggle_count += 1
-        _LOGGER.debug("Turning off heater %s", self.heater_entity_id)
         await self.hass.services.async_call(
             HOMEASSISTANT_DOMAIN,
-            SERVICE_TURN_OFF,
-            {ATTR_ENTITY_ID: self.heater_entity_id},
+            SERVICE_TURN_ON if on else SERVICE_TURN_OFF,
+            self._heater_service_data,
             context=self._context,
         )
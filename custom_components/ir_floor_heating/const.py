@@ -54,11 +54,16 @@ DEFAULT_MAINTAIN_COMFORT_LIMIT = False  # Disabled by default
 DEFAULT_SAFETY_BUDGET_CAPACITY = 2.0  # tokens (1 cycle = 2 toggles)
 DEFAULT_SAFETY_BUDGET_INTERVAL = 300  # seconds per token (12 tokens/hour)
 # PID tuning defaults (optimized for floor heating)
+PID_TIME_BASE = 60  # seconds - PID integral/derivative gains are per minute
 DEFAULT_PID_KP = 80.0  # Proportional gain
-DEFAULT_PID_KI = 2.0  # Integral gain
-DEFAULT_PID_KD = 15.0  # Derivative gain
+DEFAULT_PID_KI = 0.8  # Integral gain (per minute)
+DEFAULT_PID_KD = 37.5  # Derivative gain (minutes)
 # Floor Limiter PID tuning defaults (dual-PID architecture)
 DEFAULT_FLOOR_PID_KP = 20.0  # Floor limiter proportional gain
-DEFAULT_FLOOR_PID_KI = 0.5  # Floor limiter integral gain
-DEFAULT_FLOOR_PID_KD = 10.0  # Floor limiter derivative gain
+DEFAULT_FLOOR_PID_KI = 0.2  # Floor limiter integral gain (per minute)
+DEFAULT_FLOOR_PID_KD = 25.0  # Floor limiter derivative gain (minutes)
 MAX_DT_FOR_KALMAN_UPDATE = 3600  # Max seconds for Kalman filter update before reset
+CONTROL_UPDATES_PER_CYCLE = 6  # Kalman/PID updates per TPI cycle period
+MIN_CONTROL_INTERVAL = 10  # seconds - Lower bound for the control update interval
+FORCED_UPDATE_COOLDOWN = 0.25  # seconds - Coalesces rapid setpoint/mode changes
+HEATER_COMMAND_TIMEOUT = 30  # seconds - Resend a heater command not confirmed by then
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from .pid import PIDController
@@ -12,8 +12,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class PIDResult:
+class PIDResult(NamedTuple):
     """Result of dual-PID calculation."""
 
     room_demand: float
@@ -22,7 +21,7 @@ class PIDResult:
     floor_target: float
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ControlConfig:
     """Configuration for dual-PID calculation."""
 
@@ -81,7 +80,7 @@ class DualPIDController:
 
         return floor_target
 
-    def calculate(
+    def calculate(  # noqa: PLR0913
         self,
         *,
         room_temp: float,
@@ -89,6 +88,7 @@ class DualPIDController:
         floor_temp: float,
         config: ControlConfig,
         dt: float = 1.0,
+        floor_target: float | None = None,
     ) -> PIDResult:
         """
         Calculate demand based on room and floor conditions.
@@ -99,17 +99,19 @@ class DualPIDController:
             floor_temp: Current floor temperature
             config: Configuration for the calculation
             dt: Time delta
+            floor_target: Precomputed floor target, derived from config if None
 
         Returns:
             PIDResult containing demands and target
 
         """
         # 1. Determine floor target
-        floor_target = self.get_floor_target(
-            room_temp=room_temp,
-            target_room=target_room,
-            config=config,
-        )
+        if floor_target is None:
+            floor_target = self.get_floor_target(
+                room_temp=room_temp,
+                target_room=target_room,
+                config=config,
+            )
 
         # 2. Early exit if room is satisfied (not in maintain_comfort mode)
         # This prevents floor PID from accumulating error when heating isn't needed
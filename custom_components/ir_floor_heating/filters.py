@@ -106,20 +106,27 @@ class FusionKalmanFilter:
         self.kf.Q = np.block([[q_floor, np.zeros((2, 2))], [np.zeros((2, 2)), q_room]])
 
     def _update_h_matrix(self, m: int, n: int) -> None:
-        """Construct the measurement matrix H dynamically."""
+        """Construct the measurement matrix H and noise diagonal R dynamically."""
         h = np.zeros((m + n, 4))
         # Rows 0 to M-1 map to T_floor (index 0)
-        for i in range(m):
-            h[i, 0] = 1
+        h[:m, 0] = 1
         # Rows M to M+N-1 map to T_room (index 2)
-        for i in range(n):
-            h[m + i, 2] = 1
+        h[m:, 2] = 1
         self.kf.H = h
 
+        # Floor sensor is jittery (high R), room sensors are accurate (low R)
+        self._r_diag = np.concatenate(
+            (np.full(m, self.tuning.r_var_floor), np.full(n, self.tuning.r_var_room))
+        )
+
+        # Preallocated measurement vector, missing readings are stored as NaN
+        self._z = np.empty(m + n)
+        self._identity = np.eye(4)
+
     def update(
         self,
-        floor_values: list[float | None],
-        room_values: list[float | None],
+        floor_values: list[float | None] | np.ndarray,
+        room_values: list[float | None] | np.ndarray,
         power: float,
         dt: float | None = None,
     ) -> None:
@@ -134,41 +141,31 @@ class FusionKalmanFilter:
         self.kf.predict(u=np.array([[power]]))
 
         # 2. Prepare valid measurements (Gating)
-        z = []
-        valid_indices = []
-
-        # Collect valid floor measurements
-        for i, val in enumerate(floor_values):
-            if val is not None:
-                z.append(val)
-                valid_indices.append(i)
-
-        # Collect valid room measurements
-        for i, val in enumerate(room_values):
-            if val is not None:
-                z.append(val)
-                valid_indices.append(self.num_floor + i)
-
-        if not z:
-            return
+        # None readings become NaN and are masked out of this update
+        z = self._z
+        z[: self.num_floor] = floor_values
+        z[self.num_floor :] = room_values
+        valid = ~np.isnan(z)
 
-        # 3. Dynamic construction of H and R for this update
-        num_valid = len(z)
-        h_v = np.zeros((num_valid, 4))
-        r_diag = []
+        if not valid.any():
+            return
 
-        for i, idx in enumerate(valid_indices):
-            if idx < self.num_floor:
-                h_v[i, 0] = 1  # Map to T_floor
-                r_diag.append(self.tuning.r_var_floor)
-            else:
-                h_v[i, 2] = 1  # Map to T_room
-                r_diag.append(self.tuning.r_var_room)
+        # 3. Select the rows of H and R for the valid sensors
+        h_v = self.kf.H[valid]
+        r_v = np.diag(self._r_diag[valid])
 
-        r_v = np.diag(r_diag)
+        # 4. Update Step (Joseph form keeps P symmetric positive definite)
+        x = self.kf.x
+        p = self.kf.P
+        pht = p @ h_v.T
+        s = h_v @ pht + r_v
+        # K = P H^T S^-1, solved without forming the inverse (S is symmetric)
+        k = np.linalg.solve(s, pht.T).T
+        y = z[valid].reshape(-1, 1) - h_v @ x
+        i_kh = self._identity - k @ h_v
 
-        # 4. Update Step
-        self.kf.update(np.array(z), R=r_v, H=h_v)
+        self.kf.x = x + k @ y
+        self.kf.P = i_kh @ p @ i_kh.T + k @ r_v @ k.T
 
     @property
     def x(self) -> np.ndarray:
@@ -178,9 +175,9 @@ class FusionKalmanFilter:
     @property
     def floor_temp(self) -> float:
         """Fused floor temperature."""
-        return float(self.kf.x[0])
+        return float(self.kf.x[0, 0])
 
     @property
     def room_temp(self) -> float:
         """Fused room temperature."""
-        return float(self.kf.x[2])
+        return float(self.kf.x[2, 0])
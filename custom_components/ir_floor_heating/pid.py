@@ -7,6 +7,59 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+def _pid_step(  # noqa: PLR0913
+    error: float,
+    process_variable: float,
+    last_process_variable: float | None,
+    integral_error: float,
+    kp: float,
+    ki: float,
+    kd: float,
+    max_integral: float,
+    dt: float,
+) -> tuple[float, float]:
+    """
+    Compute a single PID step on plain floats.
+
+    Args:
+        error: Setpoint minus process variable
+        process_variable: Current value (actual temperature)
+        last_process_variable: Previous value, or None on the first step
+        integral_error: Accumulated integral error
+        kp: Proportional gain
+        ki: Integral gain
+        kd: Derivative gain
+        max_integral: Upper clamp for the integral error
+        dt: Time delta since last calculation (seconds)
+
+    Returns:
+        Tuple of the clamped demand (0-100%) and the new integral error
+
+    """
+    # Derivative on measurement to avoid setpoint kick
+    base = kp * error
+    if last_process_variable is not None and dt > 0:
+        base -= kd * (process_variable - last_process_variable) / dt
+
+    # Conditional integration: hold the integral while the output is
+    # saturated and the error would drive it further into saturation
+    demand = base + ki * integral_error
+    saturated_high = demand >= 100.0 and error > 0  # noqa: PLR2004
+    saturated_low = demand <= 0.0 and error < 0
+    if not (saturated_high or saturated_low):
+        # Integral term with anti-windup clamping
+        integral_error += error * dt
+        integral_error = max(0.0, min(max_integral, integral_error))
+        demand = base + ki * integral_error
+
+    # Clamp to 0-100%
+    if demand > 100.0:  # noqa: PLR2004
+        return 100.0, integral_error
+    if demand < 0.0:
+        return 0.0, integral_error
+    return demand, integral_error
+
+
 class PIDController:
     """Pure mathematical PID controller with anti-windup and saturation handling."""
 
@@ -31,6 +84,8 @@ class PIDController:
         self._ki = ki
         self._kd = kd
         self._name = name
+        # Integral clamp depends only on ki, so compute it once
+        self._max_integral = 100.0 / ki if ki > 0 else 0.0
 
         # State variables
         self._integral_error: float = 0.0
@@ -54,31 +109,19 @@ class PIDController:
             Demand percentage 0-100%
 
         """
-        # Calculate error
-        error = setpoint - process_variable
-
-        # Proportional term
-        p_term = self._kp * error
-
-        # Integral term with anti-windup clamping
-        self._integral_error += error * dt
-        max_integral = 100.0 / self._ki if self._ki > 0 else 0.0
-        self._integral_error = max(0.0, min(max_integral, self._integral_error))
-        i_term = self._ki * self._integral_error
-
-        # Derivative term
-        d_term = 0.0
-        if self._last_process_variable is not None:
-            pv_change = process_variable - self._last_process_variable
-            d_term = -self._kd * pv_change / dt if dt > 0 else 0.0
-
+        demand, self._integral_error = _pid_step(
+            setpoint - process_variable,
+            process_variable,
+            self._last_process_variable,
+            self._integral_error,
+            self._kp,
+            self._ki,
+            self._kd,
+            self._max_integral,
+            dt,
+        )
         self._last_process_variable = process_variable
-
-        # Calculate total demand
-        demand = p_term + i_term + d_term
-
-        # Clamp to 0-100%
-        return max(0.0, min(100.0, demand))
+        return demand
 
     def pause_integration(self) -> None:
         """
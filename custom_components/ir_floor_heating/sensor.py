@@ -11,10 +11,11 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
@@ -74,34 +75,40 @@ class IRFloorHeatingBaseSensor(SensorEntity):
         self._attr_unique_id = (
             f"{climate_entity.unique_id}_{self._attr_translation_key}"
         )
-        self._last_reported_value: Any = None
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
 
-        # Update when climate entity updates
-        @callback
-        def _handle_climate_update(_event: Event[EventStateChangedData]) -> None:
-            """Handle updates from the climate entity only if value changed."""
-            current_value = self.native_value
-            # Only write state if the value actually changed
-            if current_value != self._last_reported_value:
-                self._last_reported_value = current_value
-                self.async_write_ha_state()
-
-        # Track the climate entity state changes
+        # Follow climate state writes through the entity itself, which works
+        # whether or not the climate entity has been added yet
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._climate_entity.entity_id],
-                _handle_climate_update,
+            self._climate_entity.register_state_listener(
+                self._build_climate_update_handler()
             )
         )
 
         # Trigger initial update
         self.async_write_ha_state()
 
+    def _build_climate_update_handler(self) -> Callable[[], None]:
+        """Build the climate state change callback with hot lookups bound."""
+        get_native_value = type(self).native_value.fget
+        write_ha_state = self.async_write_ha_state
+        last_reported_value: Any = None
+
+        @callback
+        def _handle_climate_update() -> None:
+            """Handle updates from the climate entity only if value changed."""
+            nonlocal last_reported_value
+            current_value = get_native_value(self)
+            # Only write state if the value actually changed
+            if current_value != last_reported_value:
+                last_reported_value = current_value
+                write_ha_state()
+
+        return _handle_climate_update
+
 
 class IRFloorHeatingDemandSensor(IRFloorHeatingBaseSensor):
     """Sensor for heating demand percentage."""
@@ -136,7 +143,7 @@ class IRFloorHeatingIntegralErrorSensor(IRFloorHeatingBaseSensor):
     """Sensor for PID integral error term."""
 
     _attr_translation_key = "integral_error"
-    _attr_native_unit_of_measurement = "°C·s"
+    _attr_native_unit_of_measurement = "°C·min"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 1
 
@@ -178,7 +185,7 @@ class IRFloorHeatingRoomIntegralErrorSensor(IRFloorHeatingBaseSensor):
     """Sensor for room PID integral error term."""
 
     _attr_translation_key = "room_integral_error"
-    _attr_native_unit_of_measurement = "°C·s"
+    _attr_native_unit_of_measurement = "°C·min"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 1
 
@@ -192,7 +199,7 @@ class IRFloorHeatingFloorIntegralErrorSensor(IRFloorHeatingBaseSensor):
     """Sensor for floor PID integral error term."""
 
     _attr_translation_key = "floor_integral_error"
-    _attr_native_unit_of_measurement = "°C·s"
+    _attr_native_unit_of_measurement = "°C·min"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 1
 
@@ -4,15 +4,31 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import math
 from typing import TYPE_CHECKING
 
+import numpy as np
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import HomeAssistant, State
 
 _LOGGER = logging.getLogger(__name__)
 
+_INVALID_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+
+def _state_value(state: State | None, default: float) -> float:
+    """Return the finite numeric value of a state, or default if it has none."""
+    if state is None or state.state in _INVALID_STATES:
+        return default
+    try:
+        value = float(state.state)
+    except ValueError:
+        return default
+    # "nan" and "inf" parse as floats but are not usable readings
+    return value if math.isfinite(value) else default
+
 
 class SensorManager:
     """Helper to manage sensor readings."""
@@ -32,38 +48,96 @@ class SensorManager:
         self.power_sensors = power_sensors
         self.heater_entity_id = heater_entity_id
 
-    def _get_sensor_values(self, entity_ids: list[str]) -> list[float | None]:
-        """Gather float values from a list of entity IDs."""
-        values: list[float | None] = []
-        for entity_id in entity_ids:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                try:
-                    values.append(float(state.state))
-                except ValueError:
-                    values.append(None)
-            else:
-                values.append(None)
-        return values
-
-    def get_room_temperatures(self) -> list[float | None]:
-        """Get room temperature readings."""
-        return self._get_sensor_values(self.room_sensors)
-
-    def get_floor_temperatures(self) -> list[float | None]:
-        """Get floor temperature readings."""
-        return self._get_sensor_values(self.floor_sensors)
+        # Reused reading buffers, missing readings are NaN
+        self._room_buffer = np.full(len(room_sensors), np.nan)
+        self._floor_buffer = np.full(len(floor_sensors), np.nan)
+        self._floor_sensor_ids = frozenset(floor_sensors)
+
+        # Last reading per power sensor and their running sum, seeded on first use
+        self._power_values = dict.fromkeys(power_sensors, 0.0)
+        self._power_sum: float | None = None
+
+    def _read_into(self, entity_ids: list[str], buffer: np.ndarray) -> np.ndarray:
+        """Write float values from a list of entity IDs into a buffer."""
+        get_state = self.hass.states.get
+        for index, entity_id in enumerate(entity_ids):
+            buffer[index] = _state_value(get_state(entity_id), np.nan)
+        return buffer
+
+    def get_room_temperatures(self) -> np.ndarray:
+        """
+        Get room temperature readings.
+
+        Returns:
+            The reused reading buffer, NaN for unavailable sensors. It is
+            overwritten by the next call.
+
+        """
+        return self._read_into(self.room_sensors, self._room_buffer)
+
+    def get_floor_temperatures(self) -> np.ndarray:
+        """
+        Get floor temperature readings.
+
+        Returns:
+            The reused reading buffer, NaN for unavailable sensors. It is
+            overwritten by the next call.
+
+        """
+        return self._read_into(self.floor_sensors, self._floor_buffer)
+
+    def get_floor_reading(self, entity_id: str, state: State | None) -> float | None:
+        """
+        Get the reading of a single floor sensor state change.
+
+        Args:
+            entity_id: The entity that changed.
+            state: Its new state, None if it was removed.
+
+        Returns:
+            The temperature, or None if the entity is not a floor sensor or
+            its state has no usable reading.
+
+        """
+        if entity_id not in self._floor_sensor_ids:
+            return None
+        value = _state_value(state, math.nan)
+        return None if math.isnan(value) else value
+
+    def is_power_sensor(self, entity_id: str) -> bool:
+        """Return whether the entity is one of the power sensors."""
+        return entity_id in self._power_values
+
+    def update_power(self, entity_id: str, state: State | None) -> None:
+        """
+        Apply a power sensor state change to the running total.
+
+        Args:
+            entity_id: The power sensor that changed.
+            state: Its new state, None if it was removed.
+
+        """
+        if self._power_sum is None:
+            # Not seeded yet, the first total reads every sensor anyway
+            return
+
+        value = _state_value(state, 0.0)
+        self._power_sum += value - self._power_values[entity_id]
+        self._power_values[entity_id] = value
 
     def calculate_total_power(self) -> float:
         """Sum power from all power sensors or the heater entity."""
         total_power = 0.0
 
         if self.power_sensors:
-            power_values = self._get_sensor_values(self.power_sensors)
-            for val in power_values:
-                if val is not None:
-                    total_power += val
-            return total_power
+            if self._power_sum is None:
+                power_values = self._power_values
+                for entity_id in power_values:
+                    power_values[entity_id] = _state_value(
+                        self.hass.states.get(entity_id), 0.0
+                    )
+                self._power_sum = sum(power_values.values())
+            return self._power_sum
 
         # Fallback to heater attributes if no power sensors defined
         state = self.hass.states.get(self.heater_entity_id)
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class CycleInfo(NamedTuple):
+    """Diagnostic info about the current TPI cycle, in seconds."""
+
+    time_in_cycle: float
+    cycle_period: float
+    current_on_duration: float
+
+
 class TPIController:
     """
     Time Proportional & Integral Controller.
@@ -22,6 +32,9 @@ class TPIController:
         """Initialize the TPI controller."""
         self._cycle_period = cycle_period
         self._min_cycle_duration = min_cycle_duration
+        # Periods are fixed for the controller's lifetime, convert them once
+        self._cycle_period_s = cycle_period.total_seconds()
+        self._min_cycle_s = min_cycle_duration.total_seconds()
         self._cycle_start_time: datetime | None = None
 
         # Store the calculated ON duration for the current cycle
@@ -32,38 +45,79 @@ class TPIController:
         self._cycle_start_time = None
         self._current_on_duration = 0.0
 
-    def get_cycle_info(self) -> dict[str, float]:
-        """Return diagnostic info about the current cycle."""
-        now = dt_util.utcnow()
+    def get_cycle_info(self, now: datetime | None = None) -> CycleInfo:
+        """
+        Return diagnostic info about the current cycle.
+
+        Args:
+            now: The current time, defaults to utcnow.
+
+        """
         time_in_cycle = 0.0
         if self._cycle_start_time:
+            if now is None:
+                now = dt_util.utcnow()
             time_in_cycle = (now - self._cycle_start_time).total_seconds()
 
-        return {
-            "time_in_cycle": time_in_cycle,
-            "cycle_period": self._cycle_period.total_seconds(),
-            "current_on_duration": self._current_on_duration,
-        }
+        return CycleInfo(
+            time_in_cycle,
+            self._cycle_period_s,
+            self._current_on_duration,
+        )
 
-    def get_relay_state(self, demand_percent: float) -> bool:
+    def next_transition_at(
+        self, now: datetime, demand_percent: float
+    ) -> datetime | None:
+        """
+        Return the next moment the relay state may change.
+
+        Args:
+            now: The current time.
+            demand_percent: The current demand from PID (0-100).
+
+        Returns:
+            datetime | None: The end of the ON period while it is running,
+                otherwise the start of the next cycle. Returns now if no cycle
+                is running and there is demand, None if idle without demand.
+
+        """
+        if self._cycle_start_time is None:
+            return now if demand_percent > 0 else None
+
+        on_until = self._cycle_start_time + timedelta(seconds=self._current_on_duration)
+        if now < on_until:
+            return on_until
+        return self._cycle_start_time + self._cycle_period
+
+    def get_relay_state(
+        self, demand_percent: float, now: datetime | None = None
+    ) -> bool:
         """
         Calculate if relay should be ON based on latched demand for the current cycle.
 
         Args:
             demand_percent: The current demand from PID (0-100).
+            now: The current time, defaults to utcnow.
 
         Returns:
             bool: True if heater should be ON, False otherwise.
 
         """
-        now = dt_util.utcnow()
-        cycle_period_seconds = self._cycle_period.total_seconds()
+        if now is None:
+            now = dt_util.utcnow()
+        cycle_period_seconds = self._cycle_period_s
 
         # Check if we need to start a NEW cycle or initialize
         if (
             self._cycle_start_time is None
             or (now - self._cycle_start_time).total_seconds() >= cycle_period_seconds
         ):
+            if demand_percent <= 0:
+                # Stay idle instead of running empty cycles, so a new cycle
+                # starts as soon as demand returns
+                self.reset_cycle()
+                return False
+
             self._cycle_start_time = now
 
             # LATCH the demand only at the START of the cycle
@@ -71,7 +125,7 @@ class TPIController:
             on_sec = (demand_clamped / 100.0) * cycle_period_seconds
 
             # Apply relay protection constraints
-            min_duration = self._min_cycle_duration.total_seconds()
+            min_duration = self._min_cycle_s
 
             if on_sec < min_duration:
                 # If calculated time is too short, stick to 0% (OFF)
@@ -110,7 +164,8 @@ class BudgetBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_update = datetime.now(UTC)
+        # Monotonic clock: immune to wall-clock jumps and cheaper than datetime
+        self.last_update = time.monotonic()
 
     def consume(self, amount: float = 1.0, *, force: bool = False) -> bool:
         """
@@ -132,7 +187,8 @@ class BudgetBucket:
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = datetime.now(UTC)
-        delta = (now - self.last_update).total_seconds()
-        self.tokens = min(self.capacity, self.tokens + delta * self.refill_rate)
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_update) * self.refill_rate
+        )
         self.last_update = now
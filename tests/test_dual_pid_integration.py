@@ -52,6 +52,31 @@ class TestDualPIDMinSelector(unittest.TestCase):
         else:
             assert result.final_demand == result.room_demand
 
+    def test_precomputed_floor_target(self) -> None:
+        """Test a supplied floor target matches the internally derived one."""
+        config = ControlConfig(
+            max_floor_temp=28.0,
+            comfort_offset=5.0,
+            maintain_comfort=False,
+        )
+        floor_target = self.dual_pid.get_floor_target(
+            room_temp=20.0, target_room=22.0, config=config
+        )
+        expected = self.dual_pid.calculate(
+            room_temp=20.0, target_room=22.0, floor_temp=24.5, config=config
+        )
+        self.dual_pid.reset()
+
+        result = self.dual_pid.calculate(
+            room_temp=20.0,
+            target_room=22.0,
+            floor_temp=24.5,
+            config=config,
+            floor_target=floor_target,
+        )
+
+        assert result == expected
+
     def test_room_demand_dominates(self) -> None:
         """Test when room demand is lower than floor limit."""
         result = self.dual_pid.calculate(
@@ -0,0 +1,132 @@
+"""Unit tests for heater command handling."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.ir_floor_heating.climate import IRFloorHeatingClimate
+from custom_components.ir_floor_heating.const import HEATER_COMMAND_TIMEOUT
+
+
+class TestHeaterCommands(unittest.IsolatedAsyncioTestCase):
+    """Test cases for sending and confirming heater commands."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.hass = MagicMock()
+        self.hass.services.async_call = AsyncMock()
+        self.config = MagicMock()
+        self.config.max_floor_temp = 28.0
+        self.config.safety_hysteresis = 1.0
+        self.config.floor_sensors = ["sensor.floor"]
+        self.config.room_sensors = ["sensor.room"]
+        self.config.heater_entity_id = "switch.heater"
+        self.config.cycle_period = timedelta(seconds=900)
+        self.config.min_cycle_duration = timedelta(seconds=60)
+        self.config.keep_alive = None
+
+        with patch("custom_components.ir_floor_heating.climate.FusionKalmanFilter"):
+            with patch("custom_components.ir_floor_heating.climate.PIDController"):
+                with patch(
+                    "custom_components.ir_floor_heating.climate.DualPIDController"
+                ):
+                    with patch(
+                        "custom_components.ir_floor_heating.climate.TPIController"
+                    ):
+                        with patch(
+                            "custom_components.ir_floor_heating.climate.async_entity_id_to_device"
+                        ):
+                            self.climate = IRFloorHeatingClimate(self.hass, self.config)
+
+        # Heating, the heater is on but the TPI wants it off with no demand left
+        self.climate._active = True
+        self.climate._hvac_mode = HVACMode.HEAT
+        self.climate._device_active = True
+        self.climate._last_relay_state = True
+        self.climate._tpi_controller.get_relay_state.return_value = False
+        self.climate._tpi_controller.next_transition_at.return_value = None
+
+    @patch("custom_components.ir_floor_heating.climate.async_call_later")
+    @patch("custom_components.ir_floor_heating.climate.dt_util")
+    async def test_unacknowledged_command_is_resent(
+        self, mock_dt_util: MagicMock, mock_call_later: MagicMock
+    ) -> None:
+        """Test a command the heater never confirms is resent after the timeout."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mock_dt_util.utcnow.return_value = start
+
+        # OFF is sent and a retry check is armed at the timeout
+        await self.climate._async_tpi_cycle()
+        self.assertEqual(self.climate.hass.services.async_call.await_count, 1)
+        self.assertEqual(mock_call_later.call_args[0][1], HEATER_COMMAND_TIMEOUT)
+
+        # The heater never reports back, within the timeout nothing is resent
+        mock_dt_util.utcnow.return_value = start + timedelta(seconds=10)
+        await self.climate._async_tpi_cycle()
+        self.assertEqual(self.climate.hass.services.async_call.await_count, 1)
+
+        # Once the timeout has passed the command is sent again
+        mock_dt_util.utcnow.return_value = start + timedelta(
+            seconds=HEATER_COMMAND_TIMEOUT
+        )
+        await self.climate._async_tpi_cycle()
+        self.assertEqual(self.climate.hass.services.async_call.await_count, 2)
+
+    @patch("custom_components.ir_floor_heating.climate.async_call_later")
+    def test_manual_toggle_is_reconciled(self, mock_call_later: MagicMock) -> None:
+        """Test a relay toggled outside the thermostat is corrected right away."""
+        # Relay last commanded off, then switched on outside the thermostat
+        self.climate._device_active = False
+        self.climate._last_relay_state = False
+        old_state = MagicMock()
+        old_state.state = "off"
+        new_state = MagicMock()
+        new_state.state = "on"
+        event = MagicMock()
+        event.data = {
+            "entity_id": "switch.heater",
+            "new_state": new_state,
+            "old_state": old_state,
+        }
+
+        with patch.object(self.climate, "async_write_ha_state"):
+            self.climate._async_sensor_changed(event)
+
+        # The TPI step runs right away instead of at the next transition
+        self.assertTrue(self.climate._device_active)
+        mock_call_later.assert_called_once()
+        self.assertEqual(mock_call_later.call_args[0][1], 0)
+
+    @patch("custom_components.ir_floor_heating.climate.async_call_later")
+    def test_commanded_change_is_not_reconciled(
+        self, mock_call_later: MagicMock
+    ) -> None:
+        """Test a state change confirming our own command is not corrected."""
+        # The state change confirms a command the thermostat sent itself
+        self.climate._device_active = False
+        self.climate._last_relay_state = True
+        self.climate._heater_command_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        old_state = MagicMock()
+        old_state.state = "off"
+        new_state = MagicMock()
+        new_state.state = "on"
+        event = MagicMock()
+        event.data = {
+            "entity_id": "switch.heater",
+            "new_state": new_state,
+            "old_state": old_state,
+        }
+
+        with patch.object(self.climate, "async_write_ha_state"):
+            self.climate._async_sensor_changed(event)
+
+        self.assertIsNone(self.climate._heater_command_at)
+        mock_call_later.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Unit tests for the sensor fusion Kalman filter."""
+
+from __future__ import annotations
+
+import unittest
+
+from custom_components.ir_floor_heating.filters import FusionKalmanFilter
+
+
+class TestFusionKalmanFilter(unittest.TestCase):
+    """Test cases for FusionKalmanFilter class."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.kf = FusionKalmanFilter(num_floor_sensors=2, num_room_sensors=1, dt=60.0)
+
+    def test_converges_to_measurements(self) -> None:
+        """Test fused temperatures track constant sensor readings."""
+        for _ in range(50):
+            self.kf.update([25.0, 25.0], [21.0], power=0.0, dt=60.0)
+
+        assert abs(self.kf.floor_temp - 25.0) < 0.1
+        assert abs(self.kf.room_temp - 21.0) < 0.1
+
+    def test_missing_sensor_is_gated(self) -> None:
+        """Test an unavailable sensor is ignored instead of breaking the update."""
+        for _ in range(50):
+            self.kf.update([None, 25.0], [21.0], power=0.0, dt=60.0)
+
+        assert abs(self.kf.floor_temp - 25.0) < 0.1
+        assert abs(self.kf.room_temp - 21.0) < 0.1
+
+    def test_all_sensors_missing_only_predicts(self) -> None:
+        """Test the state is only predicted when no readings are available."""
+        self.kf.update([None, None], [None], power=0.0, dt=60.0)
+
+        # Initial state is 20°C with zero velocity, so prediction keeps it there
+        assert self.kf.floor_temp == 20.0
+        assert self.kf.room_temp == 20.0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,6 +64,19 @@ class TestPIDController(unittest.TestCase):
         assert result <= 100.0
         assert result == 100.0
 
+    def test_integral_held_while_saturated(self) -> None:
+        """Test the integral does not grow while P alone saturates the output."""
+        controller = PIDController(kp=50.0, ki=1.0, kd=0.0)
+        # Error = 5, P_term = 250 saturates the output before integrating
+        for _ in range(10):
+            result = controller.calculate(setpoint=5.0, process_variable=0.0, dt=1.0)
+            assert result == 100.0
+        assert controller.get_integral_error() == 0.0
+
+        # Once out of saturation the integral accumulates again
+        controller.calculate(setpoint=1.0, process_variable=0.0, dt=1.0)
+        assert controller.get_integral_error() == 1.0
+
     def test_integral_zero_ki(self) -> None:
         """Test that zero Ki doesn't cause division by zero."""
         controller = PIDController(kp=10.0, ki=0.0, kd=0.0)
@@ -1,16 +1,15 @@
 import unittest
-from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 from custom_components.ir_floor_heating.tpi import BudgetBucket
 
 
 class TestBudgetBucket(unittest.TestCase):
-    @patch("custom_components.ir_floor_heating.tpi.datetime")
-    def test_consume_and_refill(self, mock_datetime):
-        start_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        mock_datetime.now.return_value = start_time
-        mock_datetime.now.side_effect = None  # ensure it returns start_time initially
+    @patch("custom_components.ir_floor_heating.tpi.time")
+    def test_consume_and_refill(self, mock_time):
+        start_time = 1000.0
+        mock_time.monotonic.return_value = start_time
+        mock_time.monotonic.side_effect = None  # ensure it returns start_time initially
 
         # Capacity 2, refill 1 token per 100 seconds
         bucket = BudgetBucket(capacity=2.0, refill_rate=0.01)
@@ -35,12 +34,12 @@ class TestBudgetBucket(unittest.TestCase):
         self.assertEqual(bucket.tokens, -1.0)
 
         # Wait 100 seconds (should get 1 token back)
-        mock_datetime.now.return_value = start_time + timedelta(seconds=100)
+        mock_time.monotonic.return_value = start_time + 100.0
         bucket._refill()
         self.assertEqual(bucket.tokens, 0.0)
 
         # Wait another 200 seconds (should get 2 more tokens, but capped at capacity)
-        mock_datetime.now.return_value = start_time + timedelta(seconds=300)
+        mock_time.monotonic.return_value = start_time + 300.0
         bucket._refill()
         self.assertEqual(bucket.tokens, 2.0)
 
@@ -1,7 +1,10 @@
+import asyncio
 import unittest
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
+from homeassistant.components.climate import HVACMode
+
 from custom_components.ir_floor_heating.climate import IRFloorHeatingClimate
 from custom_components.ir_floor_heating.tpi import BudgetBucket
 
@@ -10,7 +13,6 @@ class TestSafetyVetoBudgetIntegration(unittest.TestCase):
     def setUp(self):
         self.hass = MagicMock()
         self.config = MagicMock()
-        self.config.hass = self.hass
         self.config.safety_budget_capacity = 2.0
         self.config.safety_budget_interval = 300.0  # 1 token per 300 seconds
         self.config.max_floor_temp = 28.0
@@ -19,6 +21,7 @@ class TestSafetyVetoBudgetIntegration(unittest.TestCase):
         self.config.room_sensors = ["sensor.room"]
         self.config.cycle_period = timedelta(seconds=900)
         self.config.min_cycle_duration = timedelta(seconds=60)
+        self.config.keep_alive = None
 
         # Mock dependencies to allow instantiation
         with patch("custom_components.ir_floor_heating.climate.FusionKalmanFilter"):
@@ -32,16 +35,16 @@ class TestSafetyVetoBudgetIntegration(unittest.TestCase):
                         with patch(
                             "custom_components.ir_floor_heating.climate.async_entity_id_to_device"
                         ):
-                            self.climate = IRFloorHeatingClimate(self.config)
+                            self.climate = IRFloorHeatingClimate(self.hass, self.config)
 
         # Ensure we have a real budget bucket for testing
         self.climate._safety_budget = BudgetBucket(2.0, 1.0 / 300.0)
 
-    @patch("custom_components.ir_floor_heating.tpi.datetime")
-    def test_veto_budget_limit(self, mock_datetime):
+    @patch("custom_components.ir_floor_heating.tpi.time")
+    def test_veto_budget_limit(self, mock_time):
         # Set start time
-        start_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        mock_datetime.now.return_value = start_time
+        start_time = 1000.0
+        mock_time.monotonic.return_value = start_time
 
         # Ensure we have a real budget bucket for testing, initialized with start_time
         self.climate._safety_budget = BudgetBucket(2.0, 1.0 / 300.0)
@@ -79,12 +82,75 @@ class TestSafetyVetoBudgetIntegration(unittest.TestCase):
 
         # 5. Wait for budget (needs 2 tokens to go from -1.0 to 1.0)
         # 2 tokens * 300 seconds = 600 seconds
-        mock_datetime.now.return_value = start_time + timedelta(seconds=600)
+        mock_time.monotonic.return_value = start_time + 600.0
         # tokens should now be 1.0
         self.assertFalse(self.climate._check_safety_veto())  # Should now release!
         self.climate._safety_veto_active = False
         self.assertEqual(self.climate._safety_budget.tokens, 0.0)
 
+    def test_inactive_veto_in_hysteresis_band(self):
+        # Floor inside the hysteresis band (27-28) must not engage the veto
+        self.climate._room_temp = 20.0
+        self.climate._floor_temp = 27.5
+        self.climate._safety_veto_active = False
+
+        self.assertFalse(self.climate._check_safety_veto())
+        self.assertEqual(self.climate._safety_budget.tokens, 2.0)
+
+    def _send_floor_reading(self, reading, fused_floor_temp):
+        # Heating with the heater on when a floor reading at the limit arrives
+        self.climate._active = True
+        self.climate._hvac_mode = HVACMode.HEAT
+        self.climate._target_temp = 21.0
+        self.climate._device_active = True
+        self.climate._final_demand_percent = 60.0
+        self.climate._kf.room_temp = 20.0
+        self.climate._kf.floor_temp = fused_floor_temp
+        self.climate._dual_pid.calculate.return_value = (60.0, 60.0, 60.0, 26.0)
+        self.climate._tpi_controller.next_transition_at.return_value = None
+        new_state = MagicMock()
+        new_state.state = str(reading)
+        event = MagicMock()
+        event.data = {
+            "entity_id": "sensor.floor",
+            "new_state": new_state,
+            "old_state": None,
+        }
+
+        with patch.object(self.climate, "async_write_ha_state"):
+            self.climate._async_sensor_changed(event)
+            # The reading triggers an early control update
+            self.hass.async_create_task.assert_called_once()
+            asyncio.run(self.hass.async_create_task.call_args[0][0])
+
+    @patch("custom_components.ir_floor_heating.climate.async_call_later")
+    def test_floor_event_engages_veto(self, mock_call_later):
+        # The fused estimate confirms the overheat
+        self._send_floor_reading(28.4, fused_floor_temp=28.2)
+
+        # Veto engaged without waiting for the periodic update, and the
+        # running cycle is cut so the TPI step turns the heater off now
+        self.assertTrue(self.climate._safety_veto_active)
+        self.assertEqual(self.climate._final_demand_percent, 0.0)
+        self.climate._tpi_controller.reset_cycle.assert_called_once()
+        self.assertEqual(mock_call_later.call_args[0][1], 0)
+
+    @patch("custom_components.ir_floor_heating.climate.async_call_later")
+    def test_noisy_floor_reading_does_not_engage_veto(self, mock_call_later):
+        # A noisy reading above the limit, the fused estimate stays below it
+        self._send_floor_reading(28.2, fused_floor_temp=27.2)
+
+        # No veto, no budget spent and the running cycle is left alone
+        self.assertFalse(self.climate._safety_veto_active)
+        self.assertEqual(self.climate._safety_budget.tokens, 2.0)
+        self.climate._tpi_controller.reset_cycle.assert_not_called()
+        self.assertEqual(self.climate._final_demand_percent, 60.0)
+
+        # The PIDs get the elapsed time in minutes, not a fixed step of 1
+        pid_dt = self.climate._dual_pid.calculate.call_args.kwargs["dt"]
+        self.assertGreater(pid_dt, 0.0)
+        self.assertLess(pid_dt, 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
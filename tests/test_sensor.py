@@ -0,0 +1,38 @@
+"""Unit tests for the diagnostic sensors."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from custom_components.ir_floor_heating.sensor import IRFloorHeatingDemandSensor
+
+
+class TestDiagnosticSensor(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the diagnostic sensor base class."""
+
+    async def test_follows_climate_without_entity_id(self) -> None:
+        """Test sensors subscribe before the climate entity has an entity_id."""
+        climate_entity = MagicMock()
+        # Not added yet, so reading the entity_id must not be needed
+        del climate_entity.entity_id
+        climate_entity.demand_percent = 10.0
+        sensor = IRFloorHeatingDemandSensor(climate_entity, MagicMock())
+
+        with patch.object(sensor, "async_write_ha_state") as mock_write:
+            await sensor.async_added_to_hass()
+            listener = climate_entity.register_state_listener.call_args[0][0]
+            mock_write.reset_mock()
+
+            # A climate state write with a new value updates the sensor
+            climate_entity.demand_percent = 20.0
+            listener()
+            mock_write.assert_called_once()
+
+            # An unchanged value does not
+            listener()
+            mock_write.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
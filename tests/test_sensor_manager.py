@@ -1,3 +1,4 @@
+import math
 from unittest.mock import MagicMock
 from custom_components.ir_floor_heating.sensor_manager import SensorManager
 
@@ -75,3 +76,103 @@ def test_calculate_total_power_unavailable_sensor():
     }.get(entity_id)
 
     assert manager.calculate_total_power() == 100.0
+
+
+def test_get_floor_temperatures_buffer():
+    """Test floor readings fill a reused buffer with NaN for missing sensors."""
+    hass = MagicMock()
+
+    manager = SensorManager(
+        hass=hass,
+        room_sensors=["sensor.room"],
+        floor_sensors=["sensor.floor1", "sensor.floor2", "sensor.floor3"],
+        power_sensors=[],
+        heater_entity_id="switch.heater",
+    )
+
+    # Mock states: one valid, one unavailable, one non-numeric
+    state1 = MagicMock()
+    state1.state = "24.5"
+    state2 = MagicMock()
+    state2.state = "unavailable"
+    state3 = MagicMock()
+    state3.state = "error"
+
+    hass.states.get.side_effect = lambda entity_id: {
+        "sensor.floor1": state1,
+        "sensor.floor2": state2,
+        "sensor.floor3": state3,
+    }.get(entity_id)
+
+    values = manager.get_floor_temperatures()
+    assert values[0] == 24.5
+    assert math.isnan(values[1])
+    assert math.isnan(values[2])
+
+    # The same buffer is refreshed on the next read
+    state2.state = "25.0"
+    assert manager.get_floor_temperatures() is values
+    assert values[1] == 25.0
+
+
+def test_calculate_total_power_incremental_update():
+    """Test power sensor changes adjust the running total without re-reading."""
+    hass = MagicMock()
+
+    manager = SensorManager(
+        hass=hass,
+        room_sensors=["sensor.room"],
+        floor_sensors=["sensor.floor"],
+        power_sensors=["sensor.power1", "sensor.power2"],
+        heater_entity_id="switch.heater",
+    )
+
+    state1 = MagicMock()
+    state1.state = "100.0"
+    state2 = MagicMock()
+    state2.state = "50.0"
+
+    hass.states.get.side_effect = lambda entity_id: {
+        "sensor.power1": state1,
+        "sensor.power2": state2,
+    }.get(entity_id)
+
+    assert manager.calculate_total_power() == 150.0
+
+    # Apply state changes as the climate entity does on state change events
+    new_state = MagicMock()
+    new_state.state = "80.0"
+    manager.update_power("sensor.power1", new_state)
+    manager.update_power("sensor.power2", None)
+
+    hass.states.get.reset_mock()
+    assert manager.calculate_total_power() == 80.0
+    hass.states.get.assert_not_called()
+
+
+def test_non_finite_readings_are_ignored():
+    """Test "nan" and "inf" states are treated as missing readings."""
+    hass = MagicMock()
+
+    manager = SensorManager(
+        hass=hass,
+        room_sensors=["sensor.room1", "sensor.room2"],
+        floor_sensors=["sensor.floor"],
+        power_sensors=["sensor.power1", "sensor.power2"],
+        heater_entity_id="switch.heater",
+    )
+
+    states = {}
+    for entity_id, value in (
+        ("sensor.room1", "nan"),
+        ("sensor.room2", "inf"),
+        ("sensor.power1", "-inf"),
+        ("sensor.power2", "40.0"),
+    ):
+        states[entity_id] = MagicMock()
+        states[entity_id].state = value
+
+    hass.states.get.side_effect = states.get
+
+    assert all(math.isnan(value) for value in manager.get_room_temperatures())
+    assert manager.calculate_total_power() == 40.0
@@ -103,7 +103,7 @@ class TestTPIController(unittest.TestCase):
 
             # Check info reflects new cycle
             info = controller.get_cycle_info()
-            assert info["time_in_cycle"] == 0.0
+            assert info.time_in_cycle == 0.0
 
     def test_reset_cycle(self) -> None:
         """Test cycle reset functionality."""
@@ -115,22 +115,60 @@ class TestTPIController(unittest.TestCase):
         self.controller.reset_cycle()
         assert self.controller._cycle_start_time is None
 
+    def test_next_transition_no_cycle(self) -> None:
+        """Test the next transition is immediate before a cycle starts."""
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        assert self.controller.next_transition_at(now, 50.0) == now
+        assert self.controller.next_transition_at(now, 0.0) is None
+
+    def test_zero_demand_stays_idle(self) -> None:
+        """Test zero demand does not start a cycle, so demand can start one."""
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        assert not self.controller.get_relay_state(0.0, start)
+        assert self.controller._cycle_start_time is None
+
+        later = start + timedelta(seconds=30)
+        assert self.controller.get_relay_state(50.0, later)
+        assert self.controller._cycle_start_time == later
+
+    def test_next_transition_on_and_off_phase(self) -> None:
+        """Test the next transition follows the ON end, then the cycle end."""
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        with patch("homeassistant.util.dt.utcnow", return_value=start):
+            self.controller.get_relay_state(demand_percent=50.0)
+
+        # 50% of a 900 s cycle keeps the relay ON for 450 s
+        on_end = start + timedelta(seconds=450)
+        assert self.controller.next_transition_at(start, 50.0) == on_end
+        assert (
+            self.controller.next_transition_at(on_end, 50.0)
+            == start + self.cycle_period
+        )
+
+    def test_explicit_timestamp(self) -> None:
+        """Test a caller-supplied timestamp is used instead of utcnow."""
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        assert self.controller.get_relay_state(50.0, start)
+        assert self.controller._cycle_start_time == start
+
+        later = start + timedelta(seconds=600)
+        assert not self.controller.get_relay_state(50.0, later)
+        assert self.controller.get_cycle_info(later).time_in_cycle == 600.0
+
     def test_get_cycle_info_no_cycle(self) -> None:
         """Test cycle info when no cycle initialized."""
         info = self.controller.get_cycle_info()
-        assert info["time_in_cycle"] == 0.0
-        assert info["cycle_period"] == 900.0
+        assert info.time_in_cycle == 0.0
+        assert info.cycle_period == 900.0
 
     def test_get_cycle_info_with_cycle(self) -> None:
         """Test cycle info after initialization."""
         self.controller.get_relay_state(demand_percent=50.0)
         info = self.controller.get_cycle_info()
 
-        assert "time_in_cycle" in info
-        assert "cycle_period" in info
-        assert info["time_in_cycle"] >= 0.0
-        assert info["time_in_cycle"] < info["cycle_period"]
-        assert info["cycle_period"] == 900.0
+        assert info.time_in_cycle >= 0.0
+        assert info.time_in_cycle < info.cycle_period
+        assert info.cycle_period == 900.0
 
     def test_demand_calculation_formula(self) -> None:
         """Test on-duration is calculated correctly from demand."""
@@ -229,7 +267,7 @@ class TestTPIControllerIntegration(unittest.TestCase):
         assert isinstance(initial_state, bool)
 
         cycle_info = controller.get_cycle_info()
-        on_duration = (40.0 / 100.0) * cycle_info["cycle_period"]
+        on_duration = (40.0 / 100.0) * cycle_info.cycle_period
         # Should be on for 360 seconds of 900 second cycle
         self.assertAlmostEqual(on_duration, 360.0, places=0)
 